@@ -310,10 +310,10 @@ class RSSM(nn.Module):
             List of tensors
         """
         return [
-            torch.zeros(batch_size, self.stoch_size).to(self.device),
-            torch.zeros(batch_size, self.stoch_size).to(self.device),
-            torch.zeros(batch_size, self.stoch_size).to(self.device),
-            torch.zeros(batch_size, self.deter_size).to(self.device),
+            torch.zeros(batch_size, self.stoch_size, device=self.device),
+            torch.zeros(batch_size, self.stoch_size, device=self.device),
+            torch.zeros(batch_size, self.stoch_size, device=self.device),
+            torch.zeros(batch_size, self.deter_size, device=self.device),
         ]
 
     def observe(self,
@@ -529,7 +529,7 @@ class DreamerModel(TorchModelV2, nn.Module):
 
     def get_initial_state(self) -> List[TensorType]:
         self.state = self.dynamics.get_initial_state(1) + [
-            torch.zeros(1, self.action_space.shape[0]).to(self.device)
+            torch.zeros(1, self.action_space.shape[0], device=self.device)
         ]
         return self.state
 
@@ -11,6 +11,12 @@ from ray.rllib.utils.typing import ModelWeights
 class RandomPolicy(Policy):
     """Hand-coded policy that returns random actions."""
 
+    # Max. number of (bounded float Box) actions to pre-draw at once.
+    ACTION_BUFFER_SIZE = 4096
+    # Max. number of scalar elements in the pre-drawn buffer (caps its
+    # memory for actions with large shapes).
+    ACTION_BUFFER_MAX_ELEMENTS = 2**16
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
@@ -27,6 +33,15 @@ class RandomPolicy(Policy):
         else:
             self.action_space_for_sampling = self.action_space
 
+        # Bounded float Boxes can be sampled for the whole batch at once.
+        # Actions are handed out as slices of a buffer of pre-drawn actions,
+        # which is replaced by a fresh one (not overwritten) once used up.
+        space = self.action_space_for_sampling
+        self._batch_sample_box = isinstance(space, Box) and \
+            space.dtype.kind == "f" and space.is_bounded()
+        self._action_buffer = None
+        self._action_buffer_idx = 0
+
     @override(Policy)
     def compute_actions(self,
                         obs_batch,
@@ -34,11 +49,34 @@ class RandomPolicy(Policy):
                         prev_action_batch=None,
                         prev_reward_batch=None,
                         **kwargs):
+        # Note: Bounded float Boxes return a single np.ndarray of shape
+        # [B, ...] here, all other spaces a list of B individual samples.
+        if self._batch_sample_box:
+            return self._sample_from_action_buffer(len(obs_batch)), [], {}
         # Alternatively, a numpy array would work here as well.
         # e.g.: np.array([random.choice([0, 1])] * len(obs_batch))
         return [self.action_space_for_sampling.sample() for _ in obs_batch], \
                [], {}
 
+    def _sample_from_action_buffer(self, n):
+        if self._action_buffer is None or \
+                self._action_buffer_idx + n > len(self._action_buffer):
+            # Draw a new buffer with a single (vectorized) numpy call.
+            space = self.action_space_for_sampling
+            action_size = max(1, int(np.prod(space.shape)))
+            size = max(
+                n,
+                min(self.ACTION_BUFFER_SIZE,
+                    self.ACTION_BUFFER_MAX_ELEMENTS // action_size))
+            self._action_buffer = space.np_random.uniform(
+                space.low, space.high,
+                size=(size, ) + space.shape).astype(space.dtype)
+            self._action_buffer_idx = 0
+        actions = self._action_buffer[self._action_buffer_idx:
+                                      self._action_buffer_idx + n]
+        self._action_buffer_idx += n
+        return actions
+
     @override(Policy)
     def learn_on_batch(self, samples):
         """No learning."""
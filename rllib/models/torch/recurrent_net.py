@@ -43,8 +43,7 @@ class RecurrentNetwork(TorchModelV2):
         @override(ModelV2)
         def get_initial_state(self):
             # Place hidden states on same device as model.
-            h = [self.fc1.weight.new(
-                1, self.rnn_hidden_dim).zero_().squeeze(0)]
+            h = [self.fc1.weight.new_zeros(self.rnn_hidden_dim)]
             return h
 
         @override(ModelV2)
@@ -234,12 +233,10 @@ class LSTMWrapper(RecurrentNetwork, nn.Module):
     @override(ModelV2)
     def get_initial_state(self) -> Union[List[np.ndarray], List[TensorType]]:
         # Place hidden states on same device as model.
+        # h- and c-states are views into one contiguous [2, cell_size] buffer.
         linear = next(self._logits_branch._model.children())
-        h = [
-            linear.weight.new(1, self.cell_size).zero_().squeeze(0),
-            linear.weight.new(1, self.cell_size).zero_().squeeze(0)
-        ]
-        return h
+        h, c = linear.weight.new_zeros(2, self.cell_size).unbind(0)
+        return [h, c]
 
     @override(ModelV2)
     def value_function(self) -> TensorType:
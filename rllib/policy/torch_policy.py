@@ -220,7 +220,10 @@ class TorchPolicy(Policy):
             Tuple[TensorType, List[TensorType], Dict[str, TensorType]]:
 
         with torch.no_grad():
-            seq_lens = torch.ones(len(obs_batch), dtype=torch.int32)
+            # Non-recurrent Models don't need seq_lens (same as in
+            # `compute_actions_from_input_dict`).
+            seq_lens = torch.ones(len(obs_batch), dtype=torch.int32) \
+                if state_batches else None
             input_dict = self._lazy_tensor_dict(
                 SampleBatch({
                     SampleBatch.CUR_OBS: np.asarray(obs_batch),
@@ -570,7 +573,10 @@ class TorchPolicy(Policy):
     @override(Policy)
     @DeveloperAPI
     def set_weights(self, weights: ModelWeights) -> None:
-        weights = convert_to_torch_tensor(weights, device=self.device)
+        # Wrap the numpy weights as cpu tensors (no copy) and let
+        # `load_state_dict` copy them straight into the Model's (possibly gpu)
+        # params. Avoids materializing a second full set of weights on device.
+        weights = convert_to_torch_tensor(weights)
         self.model.load_state_dict(weights)
 
     @override(Policy)
@@ -731,10 +737,22 @@ class TorchPolicy(Policy):
 
     @override(Policy)
     @DeveloperAPI
-    def export_checkpoint(self, export_dir: str) -> None:
-        """TODO(sven): implement for torch.
+    def export_checkpoint(self,
+                          export_dir: str,
+                          filename_prefix: str = "model") -> None:
+        """Exports the Policy's Model's weights (state dict) to local dir.
+
+        The state dict is moved to cpu and written via `torch.save`.
+
+        Args:
+            export_dir (str): Local writable directory.
+            filename_prefix (str): The file name to save the state dict
+                under.
         """
-        raise NotImplementedError
+        if not os.path.exists(export_dir):
+            os.makedirs(export_dir)
+        state_dict = {k: v.cpu() for k, v in self.model.state_dict().items()}
+        torch.save(state_dict, os.path.join(export_dir, filename_prefix))
 
     @override(Policy)
     @DeveloperAPI
@@ -6,10 +6,11 @@ import unittest
 
 import ray
 from ray.rllib.agents.registry import get_trainer_class
-from ray.rllib.utils.framework import try_import_tf
+from ray.rllib.utils.framework import try_import_tf, try_import_torch
 from ray.tune.trial import ExportFormat
 
 tf1, tf, tfv = try_import_tf()
+torch, _ = try_import_torch()
 
 CONFIGS = {
     "A3C": {
@@ -69,6 +70,18 @@ def export_test(alg_name, failures, framework="tf"):
             and os.path.exists(os.path.join(checkpoint_dir, "model.index")) \
             and os.path.exists(os.path.join(checkpoint_dir, "checkpoint"))
 
+    def valid_torch_checkpoint(checkpoint_dir):
+        file_name = os.path.join(checkpoint_dir, "model")
+        if not os.path.exists(file_name):
+            return False
+        # Make sure the exported state dict loads back into the Model.
+        model = algo.get_policy().model
+        state_dict = torch.load(file_name)
+        if state_dict.keys() != model.state_dict().keys():
+            return False
+        model.load_state_dict(state_dict)
+        return True
+
     cls = get_trainer_class(alg_name)
     config = CONFIGS[alg_name].copy()
     config["framework"] = framework
@@ -89,13 +102,15 @@ def export_test(alg_name, failures, framework="tf"):
         failures.append(alg_name)
     shutil.rmtree(export_dir)
 
-    if framework == "tf":
-        print("Exporting checkpoint", alg_name, export_dir)
-        algo.export_policy_checkpoint(export_dir)
-        if framework == "tf" and not valid_tf_checkpoint(export_dir):
-            failures.append(alg_name)
-        shutil.rmtree(export_dir)
+    print("Exporting checkpoint", alg_name, export_dir)
+    algo.export_policy_checkpoint(export_dir)
+    valid_checkpoint = valid_tf_checkpoint if framework == "tf" else \
+        valid_torch_checkpoint
+    if not valid_checkpoint(export_dir):
+        failures.append(alg_name)
+    shutil.rmtree(export_dir)
 
+    if framework == "tf":
         print("Exporting default policy", alg_name, export_dir)
         algo.export_model([ExportFormat.CHECKPOINT, ExportFormat.MODEL],
                           export_dir)
@@ -0,0 +1,81 @@
+from gym.spaces import Box, Discrete
+import numpy as np
+import unittest
+
+from ray.rllib.examples.policy.random_policy import RandomPolicy
+
+
+class TestRandomPolicy(unittest.TestCase):
+    def setUp(self) -> None:
+        self.obs_space = Box(-1.0, 1.0, shape=(4, ), dtype=np.float32)
+        self.action_space = Box(-1.0, 2.0, shape=(2, ), dtype=np.float32)
+
+    def _actions(self, policy, n):
+        actions, state_outs, _ = policy.compute_actions(np.zeros((n, 4)))
+        self.assertEqual(state_outs, [])
+        return actions
+
+    def test_bounded_box_actions(self):
+        policy = RandomPolicy(self.obs_space, self.action_space, {})
+        actions = self._actions(policy, 10)
+        self.assertIsInstance(actions, np.ndarray)
+        self.assertEqual(actions.shape, (10, 2))
+        self.assertEqual(actions.dtype, np.float32)
+        self.assertTrue(np.all(actions >= -1.0))
+        self.assertTrue(np.all(actions <= 2.0))
+
+    def test_buffer_refill(self):
+        policy = RandomPolicy(self.obs_space, self.action_space, {})
+        n = 1000
+        handed_out = []
+        # Cross the buffer's boundary (at least) twice.
+        for _ in range(2 * RandomPolicy.ACTION_BUFFER_SIZE // n + 1):
+            actions = self._actions(policy, n)
+            self.assertEqual(actions.shape, (n, 2))
+            self.assertTrue(np.all(actions >= -1.0))
+            self.assertTrue(np.all(actions <= 2.0))
+            handed_out.append((actions, actions.copy()))
+        # Earlier slices must not be altered by any of the refills.
+        for actions, copy_ in handed_out:
+            self.assertTrue(np.array_equal(actions, copy_))
+
+    def test_batch_larger_than_buffer(self):
+        policy = RandomPolicy(self.obs_space, self.action_space, {})
+        n = RandomPolicy.ACTION_BUFFER_SIZE + 10
+        actions = self._actions(policy, n)
+        self.assertEqual(actions.shape, (n, 2))
+        self.assertTrue(np.all(actions >= -1.0))
+        self.assertTrue(np.all(actions <= 2.0))
+        # Works again right after.
+        self.assertEqual(self._actions(policy, 3).shape, (3, 2))
+
+    def test_large_action_shape_caps_buffer(self):
+        action_space = Box(0.0, 1.0, shape=(64, 64, 3), dtype=np.float32)
+        policy = RandomPolicy(self.obs_space, action_space, {})
+        actions = self._actions(policy, 1)
+        self.assertEqual(actions.shape, (1, 64, 64, 3))
+        # Only as many actions pre-drawn as fit into the element cap (but at
+        # least one batch).
+        self.assertLessEqual(policy._action_buffer.size,
+                             RandomPolicy.ACTION_BUFFER_MAX_ELEMENTS)
+
+    def test_per_item_sampling_paths(self):
+        # Unbounded (ignore_action_bounds) Box: per-item `sample()`.
+        policy = RandomPolicy(self.obs_space, self.action_space,
+                              {"ignore_action_bounds": True})
+        actions = self._actions(policy, 5)
+        self.assertIsInstance(actions, list)
+        self.assertEqual(len(actions), 5)
+        self.assertIsNone(policy._action_buffer)
+        # Discrete: per-item `sample()`.
+        policy = RandomPolicy(self.obs_space, Discrete(3), {})
+        actions = self._actions(policy, 5)
+        self.assertIsInstance(actions, list)
+        self.assertTrue(all(0 <= a < 3 for a in actions))
+        self.assertIsNone(policy._action_buffer)
+
+
+if __name__ == "__main__":
+    import pytest
+    import sys
+    sys.exit(pytest.main(["-v", __file__]))
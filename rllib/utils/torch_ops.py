@@ -110,6 +110,10 @@ def convert_to_torch_tensor(x, device=None):
             tensor = tensor.float()
         return tensor if device is None else tensor.to(device)
 
+    # Single (non-nested) leaf, e.g. a lazily converted SampleBatch column:
+    # Skip the dm-tree traversal.
+    if isinstance(x, np.ndarray) or torch.is_tensor(x):
+        return mapping(x)
     return tree.map_structure(mapping, x)
 
 